@@ -1,4 +1,7 @@
+import asyncio
 import logging
+import time
+import typing
 
 import pymodbus.exceptions
 import voluptuous as vol
@@ -41,33 +44,36 @@ SERVICE_SET_POWER_SCHEMA = SERVICE_BASE_SCHEMA.extend(  # type: ignore
     }
 )
 
-PLATFORMS = [Platform.SENSOR, Platform.SWITCH, Platform.WATER_HEATER]
+PLATFORMS = [Platform.SENSOR, Platform.SWITCH]
 
+# Firmware versions are reused for reloads happening within this many seconds.
+SW_VERSION_TTL = 60.0
 
-async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
-    async def handle_activate_boost(call: ServiceCall) -> None:
-        component = _get_component_by_sn(hass, call.data.get(ATTR_DEVICE))
-        await component.handle_activate_boost(call)
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_ACTIVATE_BOOST,
-        handle_activate_boost,
-        SERVICE_ACTIVATE_BOOST_SCHEMA,
-    )
+# Maps each service to the name of the Component method handling it.
+_SERVICES = (
+    (SERVICE_ACTIVATE_BOOST, "handle_activate_boost", SERVICE_ACTIVATE_BOOST_SCHEMA),
+    (SERVICE_SET_POWER, "handle_set_power", SERVICE_SET_POWER_SCHEMA),
+)
 
-    async def handle_set_power(call: ServiceCall) -> None:
+
+def _make_service_handler(
+    hass: HomeAssistant, method: str
+) -> typing.Callable[[ServiceCall], typing.Awaitable[None]]:
+    async def handle_service(call: ServiceCall) -> None:
         component = _get_component_by_sn(hass, call.data.get(ATTR_DEVICE))
-        await component.handle_set_power(call)
+        await getattr(component, method)(call)
 
-    hass.services.async_register(
-        DOMAIN, SERVICE_SET_POWER, handle_set_power, SERVICE_SET_POWER_SCHEMA
-    )
+    return handle_service
 
-    return True
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    for service, method, schema in _SERVICES:
+        hass.services.async_register(
+            DOMAIN, service, _make_service_handler(hass, method), schema
+        )
 
-_LOADED_ENTRIES: list[str] = []
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -78,47 +84,65 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except pymodbus.exceptions.ConnectionException:
         raise ConfigEntryNotReady
 
-    device.start()
+    try:
+        sw_version, operation_mode = await asyncio.gather(
+            _get_sw_version(hass, device), device.operation_mode
+        )
+    except BaseException:
+        # the update loop isn't running yet, only the connection needs to go.
+        await device.registers.disconnect()
+        raise
 
-    sw_version = await device.registers.get_control_firmware_version()
+    device.start()
 
     device_info: DeviceInfo = {
         "identifiers": {(DOMAIN, device.serial_number)},
         "manufacturer": "my-PV",
         "name": data["name"],
-        "sw_version": ".".join(map(str, sw_version)),
+        "sw_version": sw_version,
     }
 
     device_registry = dr.async_get(hass)
     device_registry.async_get_or_create(config_entry_id=entry.entry_id, **device_info)
 
-    get_components(hass)[entry.entry_id] = Component(hass, device, device_info)
+    platforms = list(PLATFORMS)
+    if operation_mode.has_ww:
+        platforms.append(Platform.WATER_HEATER)
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    _get_store(hass).add(
+        entry.entry_id, Component(hass, device, device_info, platforms)
+    )
+
+    await hass.config_entries.async_forward_entry_setups(entry, platforms)
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
+    component = get_component(hass, config_entry.entry_id)
     unload_ok = await hass.config_entries.async_unload_platforms(
-        config_entry, PLATFORMS
+        config_entry, component.platforms
     )
     if unload_ok:
-        component = get_components(hass).pop(config_entry.entry_id)
+        _get_store(hass).pop(config_entry.entry_id)
         await component.shutdown()
 
     return unload_ok
 
 
 class Component:
+    __slots__ = ("hass", "device", "device_info", "platforms")
+
     def __init__(
         self,
         hass: HomeAssistant,
         device: ACThor,
         device_info: DeviceInfo,
+        platforms: list[Platform],
     ) -> None:
         self.hass = hass
         self.device = device
         self.device_info = device_info
+        self.platforms = platforms
 
     @property
     def device_name(self) -> str:
@@ -133,39 +157,75 @@ class Component:
 
     async def handle_set_power(self, call: ServiceCall) -> None:
         data = call.data
-        power = int(data[ATTR_POWER])
+        power: int = data[ATTR_POWER]
         if data[ATTR_OVERRIDE]:
             await self.device.set_power_override(power, mode=data.get(ATTR_MODE))
         else:
             await self.device.set_power_excess(power)
 
 
-def get_components(hass: HomeAssistant) -> dict[str, Component]:
-    ret: dict[str, Component]
+class ComponentStore:
+    __slots__ = ("by_entry", "by_sn", "sw_versions")
+
+    def __init__(self) -> None:
+        self.by_entry: dict[str, Component] = {}
+        self.by_sn: dict[str, Component] = {}
+        self.sw_versions: dict[str, tuple[float, str]] = {}
+
+    def add(self, entry_id: str, component: Component) -> None:
+        self.by_entry[entry_id] = component
+        self.by_sn[component.device.serial_number] = component
+
+    def pop(self, entry_id: str) -> Component:
+        component = self.by_entry.pop(entry_id)
+        self.by_sn.pop(component.device.serial_number, None)
+        return component
+
+
+def _get_store(hass: HomeAssistant) -> ComponentStore:
+    ret: ComponentStore
     try:
         ret = hass.data[ACTHOR_DATA]
     except KeyError:
-        ret = hass.data[ACTHOR_DATA] = {}
+        ret = hass.data[ACTHOR_DATA] = ComponentStore()
     return ret
 
 
+async def _get_sw_version(hass: HomeAssistant, device: ACThor) -> str:
+    cache = _get_store(hass).sw_versions
+    now = time.monotonic()
+    try:
+        ts, version = cache[device.serial_number]
+    except KeyError:
+        pass
+    else:
+        if now - ts < SW_VERSION_TTL:
+            return version
+
+    version = await device.get_sw_version()
+    cache[device.serial_number] = (now, version)
+    return version
+
+
+def get_components(hass: HomeAssistant) -> dict[str, Component]:
+    return _get_store(hass).by_entry
+
+
 def get_component(hass: HomeAssistant, entry_id: str) -> Component:
     return get_components(hass)[entry_id]
 
 
 def _get_component_by_sn(hass: HomeAssistant, sn: str | None) -> Component:
-    comps = get_components(hass)
+    by_sn = _get_store(hass).by_sn
     if sn is None:
-        if len(comps) != 1:
+        if len(by_sn) != 1:
             raise ValueError(
                 "device serial number must be specified when there isn't exactly one device"
             )
 
-        return next(iter(comps.values()))
-
-    sn = str(sn)
-    for c in comps.values():
-        if c.device.serial_number == sn:
-            return c
+        return next(iter(by_sn.values()))
 
-    raise ValueError("no device with serial number found")
+    try:
+        return by_sn[sn]
+    except KeyError:
+        raise ValueError("no device with serial number found") from None
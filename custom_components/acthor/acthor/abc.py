@@ -1,6 +1,10 @@
 import abc
+import asyncio
 import typing
 
+# Modbus limits a single read to 125 registers.
+MAX_READ_COUNT = 125
+
 
 class ABCModbusProtocol(abc.ABC):
     __slots__ = ()
@@ -13,7 +17,9 @@ class ABCModbusProtocol(abc.ABC):
     async def read_register(self, address: int) -> int: ...
 
     @abc.abstractmethod
-    async def read_registers(self, address: int, count: int) -> tuple[int, ...]: ...
+    async def read_registers(
+        self, address: int, count: int
+    ) -> typing.Sequence[int]: ...
 
     @abc.abstractmethod
     async def write_register(self, address: int, value: int) -> None: ...
@@ -21,35 +27,135 @@ class ABCModbusProtocol(abc.ABC):
     @abc.abstractmethod
     async def write_registers(self, address: int, values: list[int]) -> None: ...
 
-
-class BaseRegister:
-    __slots__ = ("_addr",)
-
-    def __init__(self, addr: int) -> None:
+    async def read_batch(
+        self, registers: typing.Sequence["BaseRegister"], *, max_hole: int = 8
+    ) -> list[typing.Any]:
+        """Read multiple registers using as few requests as possible.
+
+        Args:
+            registers: Registers to read.
+            max_hole: Maximum number of unused registers to read in order to
+                merge two requests.
+
+        Returns:
+            Decoded values in the same order as `registers`.
+        """
+        reads = plan_reads(
+            ((reg._addr, reg._length) for reg in registers), max_hole=max_hole
+        )
+        results = await asyncio.gather(
+            *(self.read_registers(addr, count) for addr, count in reads)
+        )
+
+        values: list[typing.Any] = []
+        for reg in registers:
+            for (start, count), block in zip(reads, results):
+                offset = reg._addr - start
+                if offset >= 0 and offset + reg._length <= count:
+                    values.append(reg.decode(block[offset : offset + reg._length]))
+                    break
+            else:
+                # skipping it would misalign all following values
+                raise ValueError(f"{reg!r} isn't covered by any read")
+        return values
+
+
+def plan_reads(
+    spans: typing.Iterable[tuple[int, int]],
+    *,
+    max_hole: int = 8,
+    max_count: int = MAX_READ_COUNT,
+) -> list[tuple[int, int]]:
+    """Group register spans into contiguous reads.
+
+    Spans separated by at most `max_hole` unused registers share a read as long
+    as it doesn't exceed `max_count` registers.
+
+    Args:
+        spans: (address, count) tuples of the registers to read.
+
+    Returns:
+        List of (address, count) tuples sorted by address.
+    """
+    bounds = sorted({(addr, addr + count) for addr, count in spans})
+    merged: list[list[int]] = []
+    for start, stop in bounds:
+        if merged:
+            last = merged[-1]
+            new_stop = max(last[1], stop)
+            if start - last[1] <= max_hole and new_stop - last[0] <= max_count:
+                last[1] = new_stop
+                continue
+        merged.append([start, stop])
+
+    return [(start, stop - start) for start, stop in merged]
+
+
+def get_scan_intervals(cls: type) -> dict[int, float]:
+    """Collect the scan intervals of all registers defined on a class.
+
+    Returns:
+        Mapping from address to the number of seconds a read value stays valid.
+        Registers without a scan interval are left out.
+    """
+    intervals: dict[int, float] = {}
+    for klass in reversed(cls.__mro__):
+        for value in vars(klass).values():
+            if not isinstance(value, BaseRegister) or value._scan_interval is None:
+                continue
+            for addr in range(value._addr, value._addr + value._length):
+                intervals[addr] = value._scan_interval
+
+    return intervals
+
+
+class BaseRegister(abc.ABC):
+    __slots__ = ("_addr", "_length", "_scan_interval")
+
+    def __init__(
+        self, addr: int, length: int = 1, *, scan_interval: float | None = None
+    ) -> None:
         self._addr = addr
+        self._length = length
+        self._scan_interval = scan_interval
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self._addr})"
 
+    @abc.abstractmethod
+    def decode(self, values: typing.Sequence[int]) -> typing.Any:
+        """Decode the raw register values read from the device."""
+
 
 class SingleRegister(BaseRegister):
     __slots__ = ("_factor",)
 
-    def __init__(self, addr: int, factor: float | None = None):
-        super().__init__(addr)
+    def __init__(
+        self,
+        addr: int,
+        factor: float | None = None,
+        *,
+        scan_interval: float | None = None,
+    ):
+        super().__init__(addr, scan_interval=scan_interval)
 
         if factor == 0:
             raise ValueError("factor must not be 0")
 
         self._factor = factor
 
-    async def read(self, protocol: ABCModbusProtocol) -> float | int:
-        value = await protocol.read_register(self._addr)
+    def _scale(self, value: int) -> float | int:
         if self._factor is not None:
-            value /= self._factor
+            return value / self._factor
 
         return value
 
+    def decode(self, values: typing.Sequence[int]) -> float | int:
+        return self._scale(values[0])
+
+    async def read(self, protocol: ABCModbusProtocol) -> float | int:
+        return self._scale(await protocol.read_register(self._addr))
+
     async def write(self, protocol: ABCModbusProtocol, value: float | int) -> None:
         if self._factor is not None:
             value *= self._factor
@@ -58,19 +164,28 @@ class SingleRegister(BaseRegister):
 
 
 class MultiRegister(BaseRegister):
-    __slots__ = ("_length", "_factor")
+    __slots__ = ("_factor",)
 
-    def __init__(self, addr: int, length: int, *, factor: float | None = None) -> None:
-        super().__init__(addr)
-        self._length = length
+    def __init__(
+        self,
+        addr: int,
+        length: int,
+        *,
+        factor: float | None = None,
+        scan_interval: float | None = None,
+    ) -> None:
+        super().__init__(addr, length, scan_interval=scan_interval)
         self._factor = factor
 
     async def read(self, protocol: ABCModbusProtocol) -> tuple[int | float, ...]:
-        values = await protocol.read_registers(self._addr, self._length)
+        return self.decode(await protocol.read_registers(self._addr, self._length))
+
+    def decode(self, values: typing.Sequence[int]) -> tuple[int | float, ...]:
         fac = self._factor
         if fac is None:
-            return values
+            return tuple(values)
 
+        # Divide instead of multiplying by the reciprocal, ``x * 0.1`` isn't exact.
         return tuple(val / fac for val in values)
 
     async def write(
@@ -2,12 +2,15 @@ import abc
 import asyncio
 import enum
 import logging
+import socket
+import time
 import typing
 
 import pymodbus.exceptions
 from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.pdu.register_read_message import ReadHoldingRegistersResponse
 
+from .abc import get_scan_intervals, plan_reads
 from .event_target import EventTarget
 from .registers import ACThorRegistersMixin
 
@@ -16,6 +19,30 @@ logger = logging.getLogger(__name__)
 # The port cannot be changed in the AC THOR
 MODBUS_PORT = 502
 
+# Seconds to wait for further changes before writing a new power target.
+POWER_WRITE_DELAY = 0.1
+
+# TCP keepalive idle time, probe interval and probe count in seconds.
+_KEEPALIVE_OPTIONS = (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+
+
+def _enable_keepalive(client: AsyncModbusTcpClient) -> None:
+    """Detect dead connections to the device without waiting for a request.
+
+    asyncio already disables Nagle's algorithm for TCP transports.
+    """
+    transport = client.ctx.transport
+    sock = transport.get_extra_info("socket") if transport is not None else None
+    if sock is None:
+        return
+
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    for name, value in _KEEPALIVE_OPTIONS:
+        # not all of these are available on every platform
+        opt = getattr(socket, name, None)
+        if opt is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, opt, value)
+
 
 async def test_connection(host: str, *, timeout: float | None = None) -> bool:
     client = AsyncModbusTcpClient(host, port=MODBUS_PORT, timeout=timeout or 3.0)
@@ -33,21 +60,52 @@ class ACThorRegistersMixinWithEvents(EventTarget, ACThorRegistersMixin, abc.ABC)
     async def disconnect(self) -> None: ...
 
 
+# (address, count, future) of a read waiting to be sent
+_PendingRead = tuple[int, int, "asyncio.Future[typing.Sequence[int]]"]
+
+
 class ACThorRegisters(ACThorRegistersMixinWithEvents):
-    __slots__ = ("_client", "_lock")
+    __slots__ = (
+        "_client",
+        "_scan_intervals",
+        "_cache",
+        "_pending_reads",
+        "_flush_handle",
+        "_read_tasks",
+    )
 
     def __init__(self, client: AsyncModbusTcpClient) -> None:
         super().__init__()
 
+        # pymodbus serializes concurrent requests on the client itself, see:
+        #   https://github.com/riptideio/pymodbus/issues/475
         self._client = client
-        # FIXME lock here because pymodbus currently can't handle concurrent requests.
-        #   see: https://github.com/riptideio/pymodbus/issues/475
-        self._lock = asyncio.Lock()
+
+        self._scan_intervals = get_scan_intervals(type(self))
+        # address -> (monotonic time of the read, value)
+        self._cache: dict[int, tuple[float, int]] = {}
+
+        # Reads requested during the current event loop iteration. They're merged
+        # into as few requests as possible once the iteration is over.
+        self._pending_reads: list[_PendingRead] = []
+        self._flush_handle: asyncio.Handle | None = None
+        self._read_tasks: set[asyncio.Task[None]] = set()
 
     @classmethod
     async def connect(cls, host: str, *, timeout: float | None = None):
         logger.info("connecting to %r", host)
-        client = AsyncModbusTcpClient(host, port=MODBUS_PORT, timeout=timeout or 3.0)
+
+        def on_connect(connected: bool) -> None:
+            # also called when pymodbus reconnects on its own
+            if connected:
+                _enable_keepalive(client)
+
+        client = AsyncModbusTcpClient(
+            host,
+            port=MODBUS_PORT,
+            timeout=timeout or 3.0,
+            on_connect_callback=on_connect,
+        )
         if not await client.connect():
             raise pymodbus.exceptions.ConnectionException("not connected")
         return cls(client)
@@ -59,60 +117,136 @@ class ACThorRegisters(ACThorRegistersMixinWithEvents):
     async def read_register(self, address: int) -> int:
         return (await self.read_registers(address, 1))[0]
 
-    async def read_registers(self, address: int, count: int) -> tuple[int, ...]:
-        async with self._lock:
+    def _read_cache(self, address: int, count: int) -> list[int] | None:
+        now = time.monotonic()
+        values: list[int] = []
+        for addr in range(address, address + count):
+            try:
+                ts, value = self._cache[addr]
+            except KeyError:
+                return None
+            if now - ts >= self._scan_intervals[addr]:
+                return None
+            values.append(value)
+
+        return values
+
+    def _update_cache(self, address: int, values: typing.Iterable[int]) -> None:
+        now = time.monotonic()
+        for addr, value in enumerate(values, address):
+            if addr in self._scan_intervals:
+                self._cache[addr] = (now, value)
+
+    async def read_registers(self, address: int, count: int) -> typing.Sequence[int]:
+        values = self._read_cache(address, count)
+        if values is not None:
+            return values
+
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future[typing.Sequence[int]] = loop.create_future()
+        self._pending_reads.append((address, count, fut))
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_soon(self._flush_reads)
+        return await fut
+
+    def _flush_reads(self) -> None:
+        self._flush_handle = None
+        pending, self._pending_reads = self._pending_reads, []
+        for address, count in plan_reads((addr, cnt) for addr, cnt, _ in pending):
+            waiters = [
+                read
+                for read in pending
+                if address <= read[0] and read[0] + read[1] <= address + count
+            ]
+            task = asyncio.create_task(self._read_block(address, count, waiters))
+            self._read_tasks.add(task)
+            task.add_done_callback(self._read_tasks.discard)
+
+    async def _read_block(
+        self, address: int, count: int, waiters: list["_PendingRead"]
+    ) -> None:
+        try:
+            values = await self._read_holding_registers(address, count)
+        except asyncio.CancelledError:
+            for _, _, fut in waiters:
+                fut.cancel()
+            raise
+        except Exception as e:
+            for _, _, fut in waiters:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+
+        for addr, cnt, fut in waiters:
+            if not fut.done():
+                offset = addr - address
+                fut.set_result(values[offset : offset + cnt])
+
+    async def _read_holding_registers(
+        self, address: int, count: int
+    ) -> typing.Sequence[int]:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("reading %r register(s) from %r", count, address)
-            tmp = self._client.read_holding_registers(address, count=count)
-            result = await typing.cast(
-                typing.Awaitable[ReadHoldingRegistersResponse], tmp
-            )
-        return tuple(result.registers)
+        tmp = self._client.read_holding_registers(address, count=count)
+        result = await typing.cast(typing.Awaitable[ReadHoldingRegistersResponse], tmp)
+        values = result.registers
+        self._update_cache(address, values)
+        return values
 
     async def write_register(self, address: int, value: int) -> None:
-        async with self._lock:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("writing %r to register %r", value, address)
-            tmp = self._client.write_register(address, value)
-            await typing.cast(typing.Awaitable[None], tmp)
+        tmp = self._client.write_register(address, value)
+        await typing.cast(typing.Awaitable[None], tmp)
+        self._update_cache(address, (value,))
 
     async def write_registers(self, address: int, values: list[int]) -> None:
-        async with self._lock:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("writing %r to registers starting at %r", values, address)
-            tmp = self._client.write_registers(address, values)  # type: ignore
-            await typing.cast(typing.Awaitable[None], tmp)
+        tmp = self._client.write_registers(address, values)  # type: ignore
+        await typing.cast(typing.Awaitable[None], tmp)
+        self._update_cache(address, values)
 
     async def disconnect(self) -> None:
         self._client.close()
 
 
 class StatusCode(int):
+    __slots__ = ()
+
+    @property
+    def _category(self) -> int:
+        if 0 <= self < len(_STATUS_CATEGORIES):
+            return _STATUS_CATEGORIES[self]
+        return _ERROR if self >= 0 else _UNKNOWN
+
     @property
     def is_off(self) -> bool:
-        return self == 0
+        return self._category == _OFF
 
     @property
     def is_startup(self) -> bool:
-        return 1 <= self <= 8
+        return self._category == _STARTUP
 
     @property
     def is_operation(self) -> bool:
-        return 9 <= self < 200
+        return self._category == _OPERATION
 
     @property
     def is_error(self) -> bool:
-        return self >= 200
+        return self._category == _ERROR
 
     @property
     def name(self) -> str:
-        if self.is_off:
-            return "off"
-        elif self.is_startup:
-            return "starting"
-        elif self.is_operation:
-            return "on"
-        elif self.is_error:
-            return "error"
-        else:
-            return "unknown"
+        return _STATUS_NAMES[self._category]
+
+
+_OFF, _STARTUP, _OPERATION, _ERROR, _UNKNOWN = range(5)
+_STATUS_NAMES = ("off", "starting", "on", "error", "unknown")
+# Category of every status code a register byte can hold, indexed by code.
+_STATUS_CATEGORIES = bytes([_OFF] + 8 * [_STARTUP] + 191 * [_OPERATION] + 56 * [_ERROR])
+# Shared instances for the codes the device reports in practice.
+_STATUS_CODES = {code: StatusCode(code) for code in range(256)}
 
 
 class OperationState(enum.IntEnum):
@@ -147,15 +281,31 @@ class OperationMode(enum.IntEnum):
 
     @property
     def single_mode(self) -> bool:
-        return self not in (self.WW_AND_PUMP, self.WW_AND_HEATING, self.WW_AND_PWM)
+        return self not in _MULTI_MODES
 
     @property
     def has_ww(self) -> bool:
-        return self.WW_3KW <= self <= self.WW_AND_HEATING or self == self.WW_AND_PWM
+        return self in _WW_MODES
 
     @property
     def has_heating(self) -> bool:
-        return self in (self.HEATING, self.WW_AND_HEATING)
+        return self in _HEATING_MODES
+
+
+_MULTI_MODES = frozenset(
+    (OperationMode.WW_AND_PUMP, OperationMode.WW_AND_HEATING, OperationMode.WW_AND_PWM)
+)
+_WW_MODES = frozenset(
+    (
+        OperationMode.WW_3KW,
+        OperationMode.WW_LAYER,
+        OperationMode.WW_6KW,
+        OperationMode.WW_AND_PUMP,
+        OperationMode.WW_AND_HEATING,
+        OperationMode.WW_AND_PWM,
+    )
+)
+_HEATING_MODES = frozenset((OperationMode.HEATING, OperationMode.WW_AND_HEATING))
 
 
 class OverrideMode(enum.Enum):
@@ -164,6 +314,29 @@ class OverrideMode(enum.Enum):
     MINIMUM = "minimum"
 
 
+# Computes the power target from (override, excess) for each override mode.
+_POWER_TARGET_FNS: dict[OverrideMode, typing.Callable[[int, int], int]] = {
+    OverrideMode.OVERRIDE: lambda override, excess: override or excess,
+    OverrideMode.REPLACE: lambda override, excess: override,
+    OverrideMode.MINIMUM: max,
+}
+
+_REGS = ACThorRegistersMixin
+# Read together in the slow update, which also covers the regular power read.
+# Addresses close to each other share a request, the hole allows power, status and
+# tempchip to be read together.
+_SLOW_UPDATE_MAX_HOLE = 11
+_SLOW_UPDATE_REGISTERS = (
+    _REGS.power,
+    _REGS.status,
+    _REGS.tempchip,
+    _REGS.load_nominal_power,
+    _REGS.relay1_status,
+    _REGS.temp1,
+    _REGS._temp_range_2_8,
+)
+
+
 class ACThor(EventTarget):
     def __init__(
         self,
@@ -180,16 +353,27 @@ class ACThor(EventTarget):
         self.__update_interval = loop_interval
         self.__slow_update_interval = max(60, loop_interval)
         self.__run_loop_task: asyncio.Task[None] | None = None
+        self.__power_timeout = max(round(1.5 * self.__slow_update_interval), 10)
+        # (monotonic time, watts) of the last power write
+        self.__last_power_write: tuple[float, int] | None = None
+        self.__power_flush_task: asyncio.Task[None] | None = None
+        self.__after_update_task: asyncio.Task[None] | None = None
 
         self._power_excess = 0
         self._power_override = 0
         self._override_mode = OverrideMode.OVERRIDE
+        self._power_target_fn = _POWER_TARGET_FNS[self._override_mode]
 
         self.status: StatusCode | None = None
         self.load_nominal_power: int | None = None
-        self.relay1_status = 0
+        self.relay1_status = False
+        self.temp_internal: float | None = None
         self.power: int | None = None
-        self.temperatures: dict[int, float] = {}
+        # raw readings of all sensors, 0 means there's no sensor
+        self._temps: list[float] = [0.0] * 8
+        self._temps_version = 0
+        self._temperatures: dict[int, float] = {}
+        self._temperatures_version = 0
 
     def __str__(self) -> str:
         return f"ACThor#{self.serial_number}"
@@ -213,6 +397,24 @@ class ACThor(EventTarget):
     async def operation_mode(self) -> OperationMode:
         return OperationMode(await self.registers.operation_mode)
 
+    async def get_sw_version(self) -> str:
+        """Read the control firmware version as a dotted string."""
+        version = await self.registers.get_control_firmware_version()
+        return ".".join(map(str, version))
+
+    @property
+    def temperatures(self) -> dict[int, float]:
+        """Temperatures of the connected sensors by sensor number.
+
+        The same dict is returned until a reading changes.
+        """
+        if self._temperatures_version != self._temps_version:
+            self._temperatures = {
+                sensor: temp for sensor, temp in enumerate(self._temps, 1) if temp
+            }
+            self._temperatures_version = self._temps_version
+        return self._temperatures
+
     @property
     def power_excess(self) -> int:
         """Current power excess sent to the device."""
@@ -228,20 +430,34 @@ class ACThor(EventTarget):
 
     @property
     def power_target(self) -> int:
-        mode = self._override_mode
+        return self._power_target_fn(self._power_override, self._power_excess)
 
-        if mode == OverrideMode.REPLACE:
-            return self._power_override
+    async def __power_write(self, power: int) -> bool:
+        """Write the power to the device unless it's known to hold it already.
 
-        if mode == OverrideMode.MINIMUM:
-            return max(self._power_override, self._power_excess)
+        Returns:
+            Whether the power was written successfully.
+        """
+        last = self.__last_power_write
+        # The value read back from the device has to match, it may have lost it.
+        # Otherwise it only needs to be refreshed before the device's power timeout.
+        if (
+            self.power == power
+            and last is not None
+            and last[1] == power
+            and time.monotonic() - last[0] < self.__power_timeout / 2
+        ):
+            return False
 
-        # default is OVERRIDE
-        return self._power_override or self._power_excess
+        try:
+            # TODO find out why ACTHOR only uses half the excess power.
+            await _REGS.power.write(self.registers, power)
+        except Exception:
+            logger.exception("%s: failed to write power %r", self, power)
+            return False
 
-    def __power_write(self, power: int) -> None:
-        # TODO find out why ACTHOR only uses half the excess power.
-        self.registers.power = int(power)
+        self.__last_power_write = (time.monotonic(), power)
+        return True
 
     def start(self) -> None:
         logger.debug("%s: starting loop", self)
@@ -251,63 +467,102 @@ class ACThor(EventTarget):
     def stop(self) -> None:
         assert self.__run_loop_task
         self.__run_loop_task.cancel()
+        if self.__power_flush_task is not None:
+            self.__power_flush_task.cancel()
+            self.__power_flush_task = None
 
     async def _on_connected(self) -> None:
         logger.info("%s: reconnected", self)
-        self.registers.power_timeout = max(round(1.5 * self.__slow_update_interval), 10)
-
-    async def __slow_update_once(self) -> None:
-        self.status = StatusCode(await self.registers.status)
-        self.load_nominal_power = int(await self.registers.load_nominal_power)
-        self.relay1_status = bool(await self.registers.relay1_status)
+        self.registers.power_timeout = self.__power_timeout
 
-        self.temperatures.clear()
-        for sensor, temp in enumerate(await self.registers.get_temps(), 1):
-            if not temp:
-                continue
-            self.temperatures[sensor] = temp
+    def __apply_slow_update(
+        self,
+        status: int,
+        temp_internal: float,
+        load_nominal_power: int,
+        relay1_status: int,
+        temp1: float,
+        other_temps: tuple[float, ...],
+    ) -> None:
+        try:
+            self.status = _STATUS_CODES[status]
+        except KeyError:
+            self.status = StatusCode(status)
+        self.temp_internal = temp_internal
+        self.load_nominal_power = load_nominal_power
+        self.relay1_status = relay1_status != 0
+
+        temps = [temp1, *other_temps]
+        if temps != self._temps:
+            self._temps[:] = temps
+            self._temps_version += 1
+
+    async def __update_once(self, *, slow: bool) -> None:
+        if slow:
+            # power is right next to the first slow registers, so it's read with them.
+            power, *slow_values = await self.registers.read_batch(
+                _SLOW_UPDATE_REGISTERS, max_hole=_SLOW_UPDATE_MAX_HOLE
+            )
+            self.__apply_slow_update(*slow_values)
+        else:
+            power = await self.registers.power
 
-    async def __update_once(self) -> None:
-        self.power = int(await self.registers.power)
-        self.__power_write(self.power_target)
+        self.power = typing.cast(int, power)
+        await self.__power_write(self.power_target)
 
     async def __run_loop(self) -> None:
-        async def _run_update_fn(
-            fn: typing.Callable[[], typing.Awaitable[None]],
-        ) -> bool:
-            try:
-                await fn()
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                logger.exception("error while updating (%s)", fn)
-            else:
-                return True
-
-            return False
-
-        async def update_loop() -> None:
-            while True:
-                logger.debug("running update")
-                if await _run_update_fn(self.__update_once):
-                    await self.dispatch_event("after_update")
-                await asyncio.sleep(self.__update_interval)
-
-        async def slow_update_loop() -> None:
-            while True:
-                logger.debug("running slow update")
-                await _run_update_fn(self.__slow_update_once)
-                await asyncio.sleep(self.__slow_update_interval)
+        def _next_deadline(interval: float, now: float) -> float:
+            # Deadlines are aligned to multiples of the interval on the loop clock.
+            # This way all devices (and both updates) wake up together and missed
+            # runs are skipped instead of being caught up on.
+            return (now // interval + 1) * interval
 
         # on_connected isn't called for the initial connection.
         # To reach this point we MUST have connected at least once though.
         await self._on_connected()
-        await asyncio.gather(update_loop(), slow_update_loop())
 
-    async def _force_update_power(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_update = next_slow_update = loop.time()
+        while True:
+            now = loop.time()
+            slow = now >= next_slow_update
+            if slow or now >= next_update:
+                logger.debug("running update (slow: %s)", slow)
+                try:
+                    await self.__update_once(slow=slow)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception("error while updating (slow: %s)", slow)
+                else:
+                    self.__dispatch_after_update()
+
+                now = loop.time()
+                next_update = _next_deadline(self.__update_interval, now)
+                if slow:
+                    next_slow_update = _next_deadline(self.__slow_update_interval, now)
+
+            await asyncio.sleep(min(next_update, next_slow_update) - loop.time())
+
+    def __dispatch_after_update(self) -> None:
+        # Listeners only read the current state, so there's no point in queueing
+        # another dispatch while they're still handling the previous one.
+        task = self.__after_update_task
+        if task is None or task.done():
+            self.__after_update_task = self.dispatch_event("after_update")
+
+    async def __flush_power(self) -> None:
+        await asyncio.sleep(POWER_WRITE_DELAY)
+        # changes from here on need another flush
+        self.__power_flush_task = None
         power = self.power_target
-        self.__power_write(power)
-        _ = self.dispatch_event("after_write_power", power)
+        if await self.__power_write(power):
+            _ = self.dispatch_event("after_write_power", power)
+
+    async def _force_update_power(self) -> None:
+        # Rapid changes (e.g. from a slider) are coalesced into a single write.
+        if self.__power_flush_task is None:
+            self.__power_flush_task = asyncio.create_task(self.__flush_power())
 
     async def set_power_excess(self, watts: int) -> None:
         """Set the current power excess.
@@ -341,7 +596,10 @@ class ACThor(EventTarget):
             mode: Override mode. If `None`, the current value is kept.
         """
         if watts is True:
-            nominal_power = await self.registers.load_nominal_power
+            nominal_power = self.load_nominal_power
+            if nominal_power is None:
+                # not read by the slow update yet
+                nominal_power = await self.registers.load_nominal_power
             # nominal power also isn't very accurate.
             watts = int(1.25 * nominal_power) if nominal_power else 1000
         elif watts is False:
@@ -349,6 +607,7 @@ class ACThor(EventTarget):
 
         if mode is not None:
             self._override_mode = OverrideMode(mode)
+            self._power_target_fn = _POWER_TARGET_FNS[self._override_mode]
 
         self._power_override = int(watts)
         await self._force_update_power()
@@ -1,4 +1,6 @@
 import asyncio
+import collections
+import contextlib
 import inspect
 import logging
 import typing
@@ -12,18 +14,15 @@ _ListenerCallable = typing.Callable[..., typing.Awaitable[None] | None]
 class EventTarget:
     __slots__ = ("__listeners",)
 
-    __listeners: dict[str, list[_ListenerCallable]]
+    __listeners: collections.defaultdict[str, list[_ListenerCallable]]
 
     def __init__(self) -> None:
-        self.__listeners = {}
+        self.__listeners = collections.defaultdict(list)
 
     def add_listener(
         self, name: str, listener: _ListenerCallable
     ) -> typing.Callable[[], bool]:
-        try:
-            self.__listeners[name].append(listener)
-        except KeyError:
-            self.__listeners[name] = [listener]
+        self.__listeners[name].append(listener)
 
         def unsubscribe() -> bool:
             return self.remove_listener(name, listener)
@@ -32,8 +31,9 @@ class EventTarget:
 
     def remove_listener(self, name: str, listener: _ListenerCallable) -> bool:
         try:
-            self.__listeners[name].remove(listener)
-        except (KeyError, ValueError):
+            # get() so unknown names don't create an empty entry
+            self.__listeners.get(name, []).remove(listener)
+        except ValueError:
             return False
 
         return True
@@ -54,47 +54,72 @@ class EventTarget:
             exc_info=error,
         )
 
-    async def __dispatch_event_listener(
+    async def __await_listener(
         self,
         listener: _ListenerCallable,
+        res: typing.Awaitable[None],
         args: tuple[typing.Any, ...],
         kwargs: dict[str, typing.Any],
         *,
         event_name: str,
     ) -> None:
         try:
-            res = listener(*args, **kwargs)
-            if inspect.isawaitable(res):
-                await res
+            await res
         except Exception as e:
             await self.on_listener_exception(
                 listener, e, event_name=event_name, args=args, kwargs=kwargs
             )
 
     async def __dispatch_event(
-        self, name: str, args: tuple[typing.Any, ...], kwargs: dict[str, typing.Any]
+        self,
+        name: str,
+        listeners: tuple[_ListenerCallable, ...],
+        args: tuple[typing.Any, ...],
+        kwargs: dict[str, typing.Any],
     ) -> None:
-        try:
-            listeners = self.__listeners[name]
-        except KeyError:
-            return
-
-        coro_gen = (
-            self.__dispatch_event_listener(listener, args, kwargs, event_name=name)
-            for listener in listeners
-        )
-        await asyncio.gather(*coro_gen)
+        # Synchronous listeners run right away, only awaitables are gathered.
+        pending: list[typing.Awaitable[None]] = []
+        for listener in listeners:
+            try:
+                res = listener(*args, **kwargs)
+            except Exception as e:
+                await self.on_listener_exception(
+                    listener, e, event_name=name, args=args, kwargs=kwargs
+                )
+                continue
+
+            # None is by far the most common result of a synchronous listener.
+            if res is not None and inspect.isawaitable(res):
+                pending.append(
+                    self.__await_listener(listener, res, args, kwargs, event_name=name)
+                )
+
+        if len(pending) == 1:
+            await pending[0]
+        elif pending:
+            await asyncio.gather(*pending)
 
     def dispatch_event(
         self, name: str, *args: typing.Any, **kwargs: typing.Any
-    ) -> asyncio.Task[None]:
-        return asyncio.create_task(self.__dispatch_event(name, args, kwargs))
+    ) -> asyncio.Task[None] | None:
+        listeners = self.__listeners.get(name)
+        if not listeners:
+            return None
+
+        # Snapshot, listeners may unsubscribe while the event is dispatched.
+        return asyncio.create_task(
+            self.__dispatch_event(name, tuple(listeners), args, kwargs)
+        )
 
 
 class HasOptionalEventTargetMixin:
+    # Classes using the mixin need a __dict__ or a slot for the mangled
+    # `_HasOptionalEventTargetMixin__event_target` attribute.
+    __slots__ = ()
+
     @property
     def event_target(self) -> EventTarget | None:
-        return getattr(self, "__event_target", None)
+        return getattr(self, "_HasOptionalEventTargetMixin__event_target", None)
 
     @event_target.setter
     def event_target(self, value: EventTarget | None) -> None:
@@ -106,7 +131,8 @@ class HasOptionalEventTargetMixin:
 
     @event_target.deleter
     def event_target(self) -> None:
-        delattr(self, "__event_target")
+        with contextlib.suppress(AttributeError):
+            del self.__event_target
 
     def _maybe_dispatch_event(
         self, name: str, *args: typing.Any, **kwargs: typing.Any
@@ -2,6 +2,8 @@ import abc
 import asyncio
 import datetime
 import logging
+import math
+import struct
 import typing
 
 from .abc import ABCModbusProtocol, MultiRegister, SingleRegister
@@ -10,13 +12,22 @@ logger = logging.getLogger(__name__)
 
 T = typing.TypeVar("T")
 
+# hot water temperature limits are settings that rarely change
+WW_SCAN_INTERVAL = 60.0
+
+# keeps fire-and-forget writes alive until they're done
+_write_tasks: set[asyncio.Task[None]] = set()
+
 
 class ReadOnlyMixin(typing.Generic[T], abc.ABC):
     __slots__ = ()
 
     def __get__(
-        self, instance: ABCModbusProtocol, cls: typing.Any = None
+        self, instance: ABCModbusProtocol | None, cls: typing.Any = None
     ) -> typing.Coroutine[typing.Any, typing.Any, T]:
+        if instance is None:
+            # accessed on the class, used to pass the register to `read_batch`.
+            return self  # type: ignore
         return self.read(instance)
 
     def __set__(self, instance: ABCModbusProtocol, _) -> None:
@@ -30,8 +41,16 @@ class ReadWriteMixin(ReadOnlyMixin[T], abc.ABC):
     __slots__ = ()
 
     def __set__(self, instance: ABCModbusProtocol, value: T) -> None:
-        task = asyncio.create_task(self._write_handle_error(instance, value))
-        _task = task
+        # eager start runs the write up to its first suspension right away instead
+        # of going through the scheduler.
+        task = asyncio.Task(
+            self._write_handle_error(instance, value),
+            loop=asyncio.get_running_loop(),
+            eager_start=True,
+        )
+        if not task.done():
+            _write_tasks.add(task)
+            task.add_done_callback(_write_tasks.discard)
 
     async def _write_handle_error(self, instance: ABCModbusProtocol, value: T) -> None:
         try:
@@ -50,39 +69,30 @@ class ReadOnly(SingleRegister, ReadOnlyMixin[int | float]):
 class ReadOnlyText(MultiRegister, ReadOnlyMixin[str]):
     __slots__ = ()
 
-    async def read(self, protocol: ABCModbusProtocol) -> str:  # type: ignore
-        values = await super().read(protocol)
-        return "".join(
-            chr(value >> 8) + chr(value & 0xFF) for value in map(int, values)
-        )
+    def decode(self, values: typing.Sequence[int]) -> str:  # type: ignore
+        # each register holds two characters, high byte first
+        return _pack_i16s(super().decode(values)).decode("latin-1")
 
 
 class ReadWrite(SingleRegister, ReadWriteMixin[int | float]):
     __slots__ = ()
 
 
-def i16s_to_bytes(it: typing.Iterable[int]) -> typing.Iterator[int]:
-    for value in it:
-        yield from value.to_bytes(2, "big")
-
-
-def bytes_to_i16(it: typing.Iterable[int]) -> typing.Iterator[int]:
-    it = iter(it)
-    for high in it:
-        low = next(it)
-        yield (high << 8) | low
+def _pack_i16s(values: typing.Sequence[int]) -> bytes:
+    return struct.pack(f">{len(values)}H", *values)
 
 
 class ReadWriteMulti(MultiRegister, ReadWriteMixin[int]):
     __slots__ = ()
 
-    async def read(self, protocol: ABCModbusProtocol) -> int:  # type: ignore
-        values = await super().read(protocol)
-        return int.from_bytes(tuple(i16s_to_bytes(map(int, values))), "big")
+    def decode(self, values: typing.Sequence[int]) -> int:  # type: ignore
+        return int.from_bytes(_pack_i16s(super().decode(values)), "big")
 
     async def write(self, protocol: ABCModbusProtocol, value: int) -> None:  # type: ignore
         byte_parts = value.to_bytes(2 * self._length, "big")
-        await super().write(protocol, bytes_to_i16(byte_parts))
+        await super().write(
+            protocol, list(struct.unpack(f">{self._length}H", byte_parts))
+        )
 
 
 class ACThorRegistersMixin(ABCModbusProtocol, abc.ABC):
@@ -117,21 +127,23 @@ class ACThorRegistersMixin(ABCModbusProtocol, abc.ABC):
     temp8 = ReadOnly(1036, 10)
     """°C"""
 
+    _temp_registers = (temp1, temp2, temp3, temp4, temp5, temp6, temp7, temp8)
+
     # Sensors 2-8 can be read with a single instruction
     _temp_range_2_8 = MultiRegister(1030, 7, factor=10)
 
-    ww1_max = ReadWrite(1002, 10)
+    ww1_max = ReadWrite(1002, 10, scan_interval=WW_SCAN_INTERVAL)
     """°C"""
-    ww2_max = ReadWrite(1037, 10)
+    ww2_max = ReadWrite(1037, 10, scan_interval=WW_SCAN_INTERVAL)
     """°C"""
-    ww3_max = ReadWrite(1038, 10)
+    ww3_max = ReadWrite(1038, 10, scan_interval=WW_SCAN_INTERVAL)
     """°C"""
 
-    ww1_min = ReadWrite(1006, 10)
+    ww1_min = ReadWrite(1006, 10, scan_interval=WW_SCAN_INTERVAL)
     """°C"""
-    ww2_min = ReadWrite(1039, 10)
+    ww2_min = ReadWrite(1039, 10, scan_interval=WW_SCAN_INTERVAL)
     """°C"""
-    ww3_min = ReadWrite(1040, 10)
+    ww3_min = ReadWrite(1040, 10, scan_interval=WW_SCAN_INTERVAL)
     """°C"""
 
     _ww_range_2_3 = MultiRegister(1037, 4)
@@ -192,7 +204,7 @@ class ACThorRegistersMixin(ABCModbusProtocol, abc.ABC):
     """
 
     ps_firmware_version = ReadOnly(1017)
-    serial_number = ReadOnlyText(1018, 8)
+    serial_number = ReadOnlyText(1018, 8, scan_interval=math.inf)
 
     rh1_max = ReadWrite(1041, 10)
     """°C"""
@@ -246,7 +258,7 @@ class ACThorRegistersMixin(ABCModbusProtocol, abc.ABC):
     """0: off, 1: on"""
     load_state = ReadOnly(1059)
     """0: off, 1: on"""
-    load_nominal_power = ReadOnly(1060)
+    load_nominal_power = ReadOnly(1060, scan_interval=600)
     """W"""
 
     u_l1 = ReadOnly(1061)
@@ -284,7 +296,7 @@ class ACThorRegistersMixin(ABCModbusProtocol, abc.ABC):
     freq = ReadOnly(1064)
     """mHz"""
 
-    operation_mode = ReadWrite(1065)
+    operation_mode = ReadWrite(1065, scan_interval=600)
     """1-8
 
     since version a0010004
@@ -378,13 +390,16 @@ class ACThorRegistersMixin(ABCModbusProtocol, abc.ABC):
     ) -> tuple[float, float, float, float, float, float, float, float]:
         """Get the temperatures.
 
-        Reads all eight temperature sensors with only two instructions.
+        Reads all eight temperature sensors with a single instruction.
 
         Returns:
             8-tuple containing the temperatures in celsius.
         """
-        first_temp, other_temps = await asyncio.gather(
-            self.temp1, self._temp_range_2_8.read(self)
+        cls = type(self)
+        # reading the 28 registers between temp1 and temp2 is cheaper than a
+        # second round-trip.
+        first_temp, other_temps = await self.read_batch(
+            (cls.temp1, cls._temp_range_2_8), max_hole=28
         )
         return (first_temp, *other_temps)  # type: ignore
 
@@ -400,7 +415,7 @@ class ACThorRegistersMixin(ABCModbusProtocol, abc.ABC):
         if not 1 <= sensor <= 8:
             raise ValueError("sensor must be in range(1, 9)")
 
-        return await getattr(self, f"temp{sensor}")
+        return await self._temp_registers[sensor - 1].read(self)
 
     async def get_time(self) -> datetime.time:
         hour, minute, second = await self._hms_range.read(self)
@@ -7,6 +7,13 @@ from homeassistant.const import CONF_HOST, CONF_NAME
 from .acthor import test_connection
 from .const import DEVICE_NAME, DOMAIN
 
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME, default=DEVICE_NAME): str,
+        vol.Required(CONF_HOST): str,
+    }
+)
+
 
 class ACThorConfigFlow(ConfigFlow, domain=DOMAIN):
     async def async_step_user(
@@ -25,11 +32,6 @@ class ACThorConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_NAME, default=DEVICE_NAME): str,
-                    vol.Required(CONF_HOST): str,
-                }
-            ),
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
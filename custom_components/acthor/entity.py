@@ -11,54 +11,41 @@ logger = logging.getLogger(__name__)
 
 
 class ACThorEntity(Entity, abc.ABC):
+    _attr_should_poll = False
+
     def __init__(
         self, device: ACThor, device_info: DeviceInfo, *, sensor_type: str
     ) -> None:
         super().__init__()
         self._device = device
-        self._device_info = device_info
 
-        self._unsubscribe_calls: list[typing.Callable[[], typing.Any]] = []
+        self._unsub_update: typing.Callable[[], bool] | None = None
+        self._unsub_write_power: typing.Callable[[], bool] | None = None
 
-        self.__unique_id = f"{self._device.serial_number}-{sensor_type}"
-        device_name = self._device_info.get("name", "")
-        self.__name = f"{device_name} {sensor_type}"
+        device_name = device_info.get("name", "")
+        self._attr_name = f"{device_name} {sensor_type}"
+        self._attr_unique_id = f"{device.serial_number}-{sensor_type}"
+        self._attr_device_info = device_info
 
     @property
     def available(self) -> bool:
         return self._device.available
 
-    @property
-    def name(self) -> str | None:
-        return self.__name
-
-    @property
-    def unique_id(self) -> str:
-        return self.__unique_id
-
-    @property
-    def device_info(self) -> DeviceInfo | None:
-        return self._device_info
-
-    @property
-    def should_poll(self) -> bool:
-        return False
-
     async def async_added_to_hass(self) -> None:
-        self._unsubscribe_calls.extend(
-            (
-                self._device.add_listener("after_update", self.__handle_device_update),
-                self._device.add_listener(
-                    "after_write_power", self._handle_write_power
-                ),
-            )
+        self._unsub_update = self._device.add_listener(
+            "after_update", self.__handle_device_update
+        )
+        self._unsub_write_power = self._device.add_listener(
+            "after_write_power", self._handle_write_power
         )
 
     async def async_will_remove_from_hass(self) -> None:
-        for unsub in self._unsubscribe_calls:
-            unsub()
-
-        self._unsubscribe_calls.clear()
+        if self._unsub_update is not None:
+            self._unsub_update()
+            self._unsub_update = None
+        if self._unsub_write_power is not None:
+            self._unsub_write_power()
+            self._unsub_write_power = None
 
     async def __handle_device_update(self) -> None:
         try:
@@ -66,7 +53,7 @@ class ACThorEntity(Entity, abc.ABC):
         except Exception:
             logger.exception("%s failed to handle device update", type(self))
         else:
-            self.async_schedule_update_ha_state()
+            self.async_write_ha_state()
 
     @abc.abstractmethod
     async def on_device_update(self) -> None: ...
@@ -10,6 +10,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from . import ACThor, get_component
 from .entity import ACThorEntity
 
+_TEMP_SENSOR_KEYS = {sensor: f"temp_sensor_{sensor}" for sensor in range(1, 9)}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -24,6 +26,7 @@ class ACThorSensor(ACThorEntity):
     def __init__(self, device: ACThor, device_info: DeviceInfo) -> None:
         super().__init__(device, device_info, sensor_type="Sensor")
         self._state = STATE_UNKNOWN
+        self._power: int | None = None
         self._attrs: dict[str, typing.Any] = {
             "serial_number": device.serial_number,
         }
@@ -46,22 +49,27 @@ class ACThorSensor(ACThorEntity):
 
     async def _handle_write_power(self, power: int) -> None:
         self._attrs["power_target"] = power
-        self.async_schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def on_device_update(self) -> None:
         dev = self._device
-        reg = dev.registers
 
-        self._state = str(dev.power)
+        power = dev.power
+        if power != self._power:
+            self._power = power
+            self._state = str(power) if power is not None else STATE_UNKNOWN
 
         attrs = self._attrs
-        attrs["status"] = dev.status.name if dev.status is not None else None
-        attrs["status_code"] = dev.status
-        attrs["relay1_status"] = "on" if dev.relay1_status else "off"
-        attrs["override_mode"] = dev.override_mode.value
-        attrs["power_target"] = dev.power_target
-        attrs["load_nominal_power"] = dev.load_nominal_power or 0
-        attrs["temp_internal"] = await reg.tempchip
+        status = dev.status
+        attrs.update(
+            status=status.name if status is not None else None,
+            status_code=status,
+            relay1_status="on" if dev.relay1_status else "off",
+            override_mode=dev.override_mode.value,
+            power_target=dev.power_target,
+            load_nominal_power=dev.load_nominal_power or 0,
+            temp_internal=dev.temp_internal,
+        )
 
         for sensor, temp in dev.temperatures.items():
-            attrs[f"temp_sensor_{sensor}"] = temp
+            attrs[_TEMP_SENSOR_KEYS[sensor]] = temp
@@ -1,4 +1,3 @@
-import datetime
 import logging
 import time
 from typing import Any
@@ -16,6 +15,7 @@ from .entity import ACThorEntity
 logger = logging.getLogger(__name__)
 
 SECS_IN_HOUR = 60 * 60
+SECS_IN_DAY = 24 * SECS_IN_HOUR
 
 
 async def async_setup_entry(
@@ -31,8 +31,10 @@ class ACThorSwitch(ACThorEntity, SwitchEntity):
     def __init__(self, device: ACThor, device_info: DeviceInfo) -> None:
         super().__init__(device, device_info, sensor_type="Switch")
 
-        self._last_update = time.time()
-        self._next_energy_reset = 0
+        # monotonic, so clock adjustments don't distort the measured energy
+        self._last_update = time.monotonic()
+        # UTC day number the energy is accumulated for
+        self._energy_day = 0
         self._today_energy = 0
 
     @property
@@ -57,21 +59,15 @@ class ACThorSwitch(ACThorEntity, SwitchEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         await self._device.set_power_override(False)
 
-    def _reset_today_energy(self) -> None:
-        self._today_energy = 0
-        tomorrow = datetime.datetime.now(datetime.UTC) + datetime.timedelta(days=1)
-        midnight = datetime.datetime.combine(
-            tomorrow.date(), datetime.time(0, 0), tzinfo=tomorrow.tzinfo
-        )
-        self._next_energy_reset = midnight.timestamp()
-
     def _update_today_energy(self) -> None:
-        now = time.time()
+        now = time.monotonic()
         diff = now - self._last_update
         self._last_update = now
 
-        if now > self._next_energy_reset:
-            self._reset_today_energy()
+        day = int(time.time() // SECS_IN_DAY)
+        if day != self._energy_day:
+            self._energy_day = day
+            self._today_energy = 0
 
         power = self._device.power
         if not power:
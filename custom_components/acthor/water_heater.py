@@ -11,6 +11,7 @@ from homeassistant.const import STATE_OFF, STATE_ON, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util.async_ import create_eager_task
 
 from . import ACThor, get_component
 from .entity import ACThorEntity
@@ -22,10 +23,6 @@ async def async_setup_entry(
     add_entities: AddEntitiesCallback,
 ):
     component = get_component(hass, config_entry.entry_id)
-    operation_mode = await component.device.operation_mode
-    if not operation_mode.has_ww:
-        return
-
     add_entities(
         (ACThorWaterHeater(component.device, component.device_info, temp_sensor=1),)
     )
@@ -75,14 +72,18 @@ class ACThorWaterHeater(ACThorEntity, WaterHeaterEntity):
         except KeyError:
             pass
         else:
-            reg.ww1_min = float(low)
+            reg.ww1_min = self._min_temp = float(low)
 
         try:
             high = kwargs[ATTR_TARGET_TEMP_HIGH]
         except KeyError:
             pass
         else:
-            reg.ww1_max = float(high)
+            reg.ww1_max = self._max_temp = float(high)
+
+        # the limits are only re-read from the device once the register cache
+        # expires, so show the new values right away.
+        self.async_write_ha_state()
 
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         raise NotImplementedError
@@ -91,7 +92,11 @@ class ACThorWaterHeater(ACThorEntity, WaterHeaterEntity):
         dev = self._device
         reg = dev.registers
 
-        self._min_temp, self._max_temp = await asyncio.gather(reg.ww1_min, reg.ww1_max)
+        # the limits usually come from the register cache, eager tasks let them
+        # complete without waiting for the loop to start them.
+        self._min_temp, self._max_temp = await asyncio.gather(
+            create_eager_task(reg.ww1_min), create_eager_task(reg.ww1_max)
+        )
         self._temp = dev.temperatures[self._temp_sensor]
         self._on = (dev.power or 0) > 0
 